@@ -11,12 +11,20 @@ from modules.data_types import (
 from modules.exbench_module import (
     run_benchmark_for_model, 
     generate_report, 
-    save_report_to_file
+    save_report_to_file,
+    report_file_path,
+    load_results_jsonl,
 )
+from utils import setup_queue_logging
 
 app = typer.Typer()
 
 
+@app.callback()
+def main():
+    setup_queue_logging()
+
+
 @app.command()
 def ping():
     typer.echo("pong")
@@ -45,6 +53,23 @@ def ollama_bench(
         help="Limit the number of tests to run from the YAML file",
         min=1,
     ),
+    concurrency: int = typer.Option(
+        None,
+        "--concurrency",
+        "-j",
+        help="Maximum prompts in flight per model (default depends on provider)",
+        min=1,
+    ),
+    use_cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse cached LLM responses for identical model and prompt pairs",
+    ),
+    use_exec_cache: bool = typer.Option(
+        True,
+        "--exec-cache/--no-exec-cache",
+        help="Reuse execution output for identical generated code",
+    ),
 ):
     """
     Run benchmarks on Ollama models using a YAML configuration file.
@@ -98,18 +123,31 @@ def ollama_bench(
         benchmark_file=benchmark_file, results=[]
     )
 
-    for model in benchmark_file.models:
-        typer.echo(f"\nRunning benchmarks for model: {model}")
-        total_tests = len(benchmark_file.prompts)
-
-        # Run all prompts for this model at once
-        results = run_benchmark_for_model(model, benchmark_file)
-        complete_result.results.extend(results)
-
-        typer.echo(f"Completed benchmarks for model: {model}\n")
+    # Stream results to disk as they complete rather than holding them all
+    results_path = report_file_path(
+        benchmark_file.benchmark_name, output_dir, ".results.jsonl"
+    )
+    # Share execution output for identical code across this benchmark's models
+    exec_cache: dict[str, str] = {}
+    with open(results_path, "w") as results_file:
+        for model in benchmark_file.models:
+            typer.echo(f"\nRunning benchmarks for model: {model}")
+
+            # Run all prompts for this model at once
+            run_benchmark_for_model(
+                model,
+                benchmark_file,
+                concurrency=concurrency,
+                use_cache=use_cache,
+                use_exec_cache=use_exec_cache,
+                results_file=results_file,
+                exec_cache=exec_cache,
+            )
+
+            typer.echo(f"Completed benchmarks for model: {model}\n")
 
     # Generate and save report using the new function
-    report = generate_report(complete_result)
+    report = generate_report(complete_result, load_results_jsonl(results_path))
     report_path = save_report_to_file(report, output_dir)
     
     typer.echo(f"Benchmark report saved to: {report_path}")
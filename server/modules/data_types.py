@@ -91,6 +91,7 @@ class BenchPromptResponse(BaseModel):
     total_duration_ms: float
     load_duration_ms: float
     errored: Optional[bool] = None
+    cached: Optional[bool] = None  # Served from the response cache
 
 
 class ModelProvider(str, Enum):
@@ -156,6 +157,8 @@ class ExecEvalBenchmarkModelReport(BaseModel):
     average_tokens_per_second: float
     average_total_duration_ms: float
     average_load_duration_ms: float
+    # Results served from the response cache, excluded from the averages above
+    cached_count: int = 0
 
 
 class ExecEvalBenchmarkReport(BaseModel):
@@ -170,3 +173,5 @@ class ExecEvalBenchmarkReport(BaseModel):
     average_tokens_per_second: float
     average_total_duration_ms: float
     average_load_duration_ms: float
+    # Results served from the response cache, excluded from the averages above
+    cached_count: int = 0
@@ -1,31 +1,50 @@
 # ------------------------- Imports -------------------------
-from typing import List, Optional
-from datetime import datetime
+from typing import Awaitable, Callable, Iterable, Iterator, List, Optional, TextIO
 from pathlib import Path
+import asyncio
+import atexit
+import logging
+from collections import defaultdict
+from functools import lru_cache, partial
+import re
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+import os
+import orjson
 from modules.data_types import (
     ExecEvalBenchmarkFile,
     ExecEvalBenchmarkCompleteResult,
     ExeEvalBenchmarkOutputResult,
     ExecEvalBenchmarkModelReport,
     ExecEvalBenchmarkReport,
-    ModelAlias,
     ExeEvalType,
-    ModelProvider,
     BenchPromptResponse,
 )
-from modules.ollama_llm import bench_prompt
-from modules.execution_evaluators import (
-    execute_python_code,
-    eval_result_compare,
-)
+from modules import execution_evaluators
+from modules.exec_worker import ExecWorker
+from modules.execution_evaluators import eval_result_compare
+from modules.response_cache import cached_bench_prompt
 from utils import parse_markdown_backticks
 from modules import ollama_llm, anthropic_llm, deepseek_llm, gemini_llm, openai_llm
 
+logger = logging.getLogger(__name__)
+
 provider_delimiter = "~"
 
+# Provider name -> bench_prompt implementation, resolved once per model run.
+provider_bench_functions: dict[str, Callable[[str, str], BenchPromptResponse]] = {
+    "ollama": ollama_llm.bench_prompt,
+    "anthropic": anthropic_llm.bench_prompt,
+    "deepseek": deepseek_llm.bench_prompt,
+    "openai": openai_llm.bench_prompt,
+    "gemini": gemini_llm.bench_prompt,
+}
 
+# Other providers (mlx, groq, fireworks) are not wired up yet
+supported_providers = frozenset(provider_bench_functions)
+
+
+@lru_cache(maxsize=256)
 def parse_model_string(model: str) -> tuple[str, str]:
     """
     Parse model string into provider and model name.
@@ -42,26 +61,32 @@ def parse_model_string(model: str) -> tuple[str, str]:
     model_name = provider_delimiter.join(model_parts)
 
     # Validate provider
-    supported_providers = [
-        "ollama",
-        "anthropic",
-        "deepseek",
-        "openai",
-        "gemini",
-        # "mlx",
-        # "groq",
-        # "fireworks",
-    ]
     if provider not in supported_providers:
         raise ValueError(
             f"Unsupported provider: {provider}. "
-            f"Supported providers are: {', '.join(supported_providers)}"
+            f"Supported providers are: {', '.join(sorted(supported_providers))}"
         )
 
     return provider, model_name
 
 
 # ------------------------- File Operations -------------------------
+def report_file_path(benchmark_name: str, output_dir: str, suffix: str) -> str:
+    """Build a timestamped path in output_dir, creating the directory if needed."""
+    Path(output_dir).mkdir(exist_ok=True)
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime())
+    safe_benchmark_name = benchmark_name.replace(" ", "_")
+    return f"{output_dir}/{safe_benchmark_name}_{timestamp}{suffix}"
+
+
+def load_results_jsonl(path: str) -> Iterator[ExeEvalBenchmarkOutputResult]:
+    """Lazily read results streamed by run_benchmark_for_model, one per line."""
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield ExeEvalBenchmarkOutputResult.model_validate_json(line)
+
+
 def save_report_to_file(
     report: ExecEvalBenchmarkReport, output_dir: str = "reports"
 ) -> str:
@@ -74,50 +99,162 @@ def save_report_to_file(
     Returns:
         Path to the saved report file
     """
-    # Create output directory if it doesn't exist
-    Path(output_dir).mkdir(exist_ok=True)
-
-    # Generate filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_benchmark_name = report.benchmark_name.replace(" ", "_")
-    report_filename = f"{output_dir}/{safe_benchmark_name}_{timestamp}.json"
-    # Save report
-    with open(report_filename, "w") as f:
-        f.write(report.model_dump_json(indent=4))
+    report_filename = report_file_path(report.benchmark_name, output_dir, ".json")
+    # Save report, serialized with orjson straight to bytes
+    with open(report_filename, "wb") as f:
+        f.write(
+            orjson.dumps(report.model_dump(mode="json"), option=orjson.OPT_INDENT_2)
+        )
     return report_filename
 
 
 # ------------------------- Benchmark Execution -------------------------
-provider_bench_functions = {
-    "ollama": ollama_llm.bench_prompt,
-    "anthropic": anthropic_llm.bench_prompt,
-    "deepseek": deepseek_llm.bench_prompt,
-    "openai": openai_llm.bench_prompt,
-    "gemini": gemini_llm.bench_prompt,
+def split_prompt_template(template: str, variable_names: Iterable[str]) -> list[str]:
+    """Split a prompt template into alternating literal and variable segments.
+
+    Even indices are literal text, odd indices are variable names, so a
+    template only has to be scanned once per benchmark instead of once per
+    variable per prompt. Only {{name}} placeholders for the given names are
+    split out, so names may contain any characters, as with str.replace.
+    """
+    # Longest first so a name that prefixes another can't shadow it
+    names = sorted(set(variable_names), key=len, reverse=True)
+    if not names:
+        return [template]
+    pattern = re.compile(
+        r"\{\{(" + "|".join(re.escape(name) for name in names) + r")\}\}"
+    )
+    return pattern.split(template)
+
+
+def render_prompt(segments: list[str], variables: dict) -> str:
+    """Render segments from split_prompt_template with the given variables.
+
+    Placeholders without a matching variable are left untouched.
+    """
+    rendered = []
+    for i, segment in enumerate(segments):
+        if i % 2 == 0:
+            rendered.append(segment)
+        elif segment in variables:
+            rendered.append(str(variables[segment]))
+        else:
+            rendered.append(f"{{{{{segment}}}}}")
+    return "".join(rendered)
+
+
+# Maximum number of prompts in flight per provider. Ollama serves one model
+# locally, so concurrent requests only queue up behind each other.
+provider_concurrency = {
+    "ollama": 1,
 }
+# Same as the ThreadPoolExecutor default API providers used to run under
+default_concurrency = min(32, (os.cpu_count() or 1) + 4)
+
+# Generated code runs in long-lived worker processes started from
+# modules.exec_worker, which fork a child per snippet. Snippets skip
+# interpreter startup, overlap with in-flight LLM calls, can't leak state into
+# each other and can be killed outright on timeout without affecting others.
+exec_workers = os.cpu_count() or 1
+# Extra time past exec_timeout_seconds before a worker is killed, for snippets
+# that swallow the in-process TimeoutError
+exec_kill_grace_seconds = 5
+_EXEC_SLOTS = threading.BoundedSemaphore(exec_workers)
+_IDLE_EXEC_WORKERS: list[ExecWorker] = []
+# Guards _IDLE_EXEC_WORKERS, which many asyncio.to_thread workers take from
+# and return to at once
+_EXEC_WORKERS_LOCK = threading.Lock()
+
+
+def shutdown_exec_workers() -> None:
+    """Stop all idle code workers; new ones start on the next execute_code."""
+    with _EXEC_WORKERS_LOCK:
+        workers = _IDLE_EXEC_WORKERS[:]
+        _IDLE_EXEC_WORKERS.clear()
+    for worker in workers:
+        worker.close()
 
-def process_single_prompt(prompt_row, benchmark_file, provider, model_name, index, total_tests):
-    print(f"  Running test {index}/{total_tests}...")
-    
-    prompt = benchmark_file.base_prompt
-    if prompt_row.dynamic_variables:
-        for key, value in prompt_row.dynamic_variables.items():
-            prompt = prompt.replace(f"{{{{{key}}}}}", str(value))
 
-    bench_response = None
-    max_retries = 3
+atexit.register(shutdown_exec_workers)
+
+
+def execute_code(code: str) -> str:
+    """Run generated code on a warm worker process and wait for its output.
+
+    Workers are reused across snippets and only replaced after a timeout or
+    crash.
+
+    Raises:
+        TimeoutError: If the code outlives its timeout; the worker is killed
+        RuntimeError: If the worker died without reporting a result
+    """
+    timeout_seconds = execution_evaluators.exec_timeout_seconds
+    with _EXEC_SLOTS:
+        with _EXEC_WORKERS_LOCK:
+            worker = _IDLE_EXEC_WORKERS.pop() if _IDLE_EXEC_WORKERS else None
+        if worker is None or not worker.reusable:
+            if worker is not None:
+                worker.close()
+            worker = ExecWorker()
+        try:
+            return worker.run(
+                code, timeout_seconds, timeout_seconds + exec_kill_grace_seconds
+            )
+        finally:
+            if worker.reusable:
+                with _EXEC_WORKERS_LOCK:
+                    _IDLE_EXEC_WORKERS.append(worker)
+            else:
+                worker.close()
+
+
+async def execute_code_in_pool(code: str) -> str:
+    """Await execute_code without blocking the event loop."""
+    return await asyncio.to_thread(execute_code, code)
+
+
+def cached_execute_code(
+    exec_cache: dict[str, str],
+) -> Callable[[str], Awaitable[str]]:
+    """Build an execute coroutine that reuses output for identical code.
+
+    Different models often emit byte-identical snippets for the same prompt.
+    Only successful runs are stored in exec_cache; failures such as timeouts
+    raise and are retried the next time the same code comes up.
+    """
+
+    async def execute(code: str) -> str:
+        if code in exec_cache:
+            return exec_cache[code]
+        result = await execute_code_in_pool(code)
+        exec_cache[code] = result
+        return result
+
+    return execute
+
+
+async def bench_prompt_with_retries(
+    bench_fn: Callable[[str, str], BenchPromptResponse],
+    prompt: str,
+    provider: str,
+    model_name: str,
+    index: int,
+    max_retries: int = 3,
+) -> BenchPromptResponse:
+    """Run the provider's bench_prompt off the event loop, retrying on failure."""
     delay = 1
     for attempt in range(max_retries + 1):
         try:
-            bench_response = provider_bench_functions[provider](prompt, model_name)
-            break
+            return await asyncio.to_thread(bench_fn, prompt, model_name)
         except Exception as e:
             if attempt < max_retries:
-                print(f"Retry {attempt+1} for test {index} due to error: {str(e)}")
-                time.sleep(delay * (attempt + 1))
+                logger.warning(
+                    "Retry %d for test %d due to error: %s", attempt + 1, index, e
+                )
+                await asyncio.sleep(delay * (attempt + 1))
             else:
-                print(f"All retries failed for test {index}")
-                bench_response = BenchPromptResponse(
+                logger.error("All retries failed for test %d", index)
+                return BenchPromptResponse(
                     response=f"Error: {str(e)}",
                     tokens_per_second=0.0,
                     provider=provider,
@@ -126,39 +263,93 @@ def process_single_prompt(prompt_row, benchmark_file, provider, model_name, inde
                     errored=True,
                 )
 
+
+async def evaluate_num_output(
+    cleaned_code: str,
+    expected_result: str,
+    execute: Callable[[str], Awaitable[str]] = execute_code_in_pool,
+) -> tuple[str, bool]:
+    execution_result = await execute(cleaned_code)
+    correct = eval_result_compare(
+        ExeEvalType.execute_python_code_with_num_output,
+        expected_result,
+        execution_result.strip(),
+    )
+    return execution_result, correct
+
+
+async def evaluate_string_output(
+    cleaned_code: str,
+    expected_result: str,
+    execute: Callable[[str], Awaitable[str]] = execute_code_in_pool,
+) -> tuple[str, bool]:
+    execution_result = await execute(cleaned_code)
+    correct = eval_result_compare(
+        ExeEvalType.execute_python_code_with_string_output,
+        expected_result,
+        execution_result,
+    )
+    return execution_result, correct
+
+
+async def evaluate_raw_string(
+    cleaned_code: str,
+    expected_result: str,
+    execute: Callable[[str], Awaitable[str]] = execute_code_in_pool,
+) -> tuple[str, bool]:
+    correct = eval_result_compare(
+        ExeEvalType.raw_string_evaluator, expected_result, cleaned_code
+    )
+    return cleaned_code, correct
+
+
+# Evaluator -> handler returning (execution_result, correct), resolved once
+# per benchmark rather than compared against on every prompt. Handlers take
+# the cleaned code, the expected result and the code execution coroutine.
+evaluator_handlers: dict[
+    ExeEvalType,
+    Callable[[str, str, Callable[[str], Awaitable[str]]], Awaitable[tuple[str, bool]]],
+] = {
+    ExeEvalType.execute_python_code_with_num_output: evaluate_num_output,
+    ExeEvalType.execute_python_code_with_string_output: evaluate_string_output,
+    ExeEvalType.raw_string_evaluator: evaluate_raw_string,
+}
+
+
+async def process_single_prompt(
+    prompt,
+    prompt_row,
+    evaluate,
+    bench_fn,
+    sem,
+    provider,
+    model_name,
+    index,
+    total_tests,
+):
+    # Only the LLM call holds a concurrency slot, so code execution for this
+    # prompt overlaps with the next prompt's request
+    async with sem:
+        logger.info("  Running test %d/%d...", index, total_tests)
+        bench_response = await bench_prompt_with_retries(
+            bench_fn, prompt, provider, model_name, index
+        )
+
     cleaned_code = parse_markdown_backticks(bench_response.response)
-    execution_result = ""
-    expected_result = str(prompt_row.expectation).strip()
-    correct = False
-    
+    expected_result = prompt_row.expectation.strip()
+
+    execution_result: str
     try:
-        if benchmark_file.evaluator == ExeEvalType.execute_python_code_with_num_output:
-            execution_result = execute_python_code(cleaned_code)
-            parsed_execution_result = str(execution_result).strip()
-            correct = eval_result_compare(
-                benchmark_file.evaluator, expected_result, parsed_execution_result
-            )
-        elif benchmark_file.evaluator == ExeEvalType.execute_python_code_with_string_output:
-            execution_result = execute_python_code(cleaned_code)
-            correct = eval_result_compare(
-                benchmark_file.evaluator, expected_result, execution_result
-            )
-        elif benchmark_file.evaluator == ExeEvalType.raw_string_evaluator:
-            execution_result = cleaned_code
-            correct = eval_result_compare(
-                benchmark_file.evaluator, expected_result, execution_result
-            )
-        else:
-            raise ValueError(f"Unsupported evaluator: {benchmark_file.evaluator}")
+        execution_result, correct = await evaluate(cleaned_code, expected_result)
     except Exception as e:
-        print(f"Error executing code in test {index}: {e}")
+        logger.error("Error executing code in test %d: %s", index, e)
         execution_result = str(e)
         correct = False
 
     return ExeEvalBenchmarkOutputResult(
         input_prompt=prompt,
         prompt_response=bench_response,
-        execution_result=str(execution_result),
+        execution_result=execution_result,
         expected_result=expected_result,
         model=f"{provider}{provider_delimiter}{model_name}",
         correct=correct,
@@ -166,165 +357,216 @@ def process_single_prompt(prompt_row, benchmark_file, provider, model_name, inde
     )
 
 
-def run_benchmark_for_model(
-    model: str, benchmark_file: ExecEvalBenchmarkFile
+async def run_benchmark_for_model_async(
+    model: str,
+    benchmark_file: ExecEvalBenchmarkFile,
+    concurrency: Optional[int] = None,
+    use_cache: bool = True,
+    use_exec_cache: bool = True,
+    results_file: Optional[TextIO] = None,
+    exec_cache: Optional[dict[str, str]] = None,
 ) -> List[ExeEvalBenchmarkOutputResult]:
-    results = []
+    """Run every prompt of a benchmark against one model concurrently.
+
+    Args:
+        model: Model string in "provider~model_name" format
+        benchmark_file: The benchmark to run
+        concurrency: Maximum number of LLM calls in flight. Defaults to the
+            provider's entry in provider_concurrency. Code execution is not
+            counted against it.
+        use_cache: Serve identical (provider, model, prompt) calls from the
+            on-disk response cache
+        use_exec_cache: Reuse execution output for byte-identical generated
+            code. Disable for benchmarks whose code is non-deterministic.
+        results_file: If given, each result is written to it as a JSON line
+            as soon as it completes instead of being kept in memory. Read
+            them back with load_results_jsonl.
+        exec_cache: Code -> output store used when use_exec_cache is set.
+            Pass the same dict for every model of a benchmark to share
+            executions across models; defaults to a fresh dict for this run.
+
+    Returns:
+        Results in prompt order, or an empty list when streamed to results_file
+    """
     total_tests = len(benchmark_file.prompts)
 
     try:
         provider, model_name = parse_model_string(model)
     except ValueError as e:
-        print(f"Invalid model string {model}: {str(e)}")
+        logger.error("Invalid model string %s: %s", model, e)
         return []
 
-    print(f"Running benchmark with provider: {provider}, model: {model_name}")
-
-    if provider == "ollama":
-        # Sequential processing for Ollama
-        for i, prompt_row in enumerate(benchmark_file.prompts, 1):
-            result = process_single_prompt(
-                prompt_row, benchmark_file, provider, model_name, i, total_tests
-            )
-            results.append(result)
+    logger.info(
+        "Running benchmark with provider: %s, model: %s", provider, model_name
+    )
+    bench_fn = provider_bench_functions[provider]
+    if use_cache:
+        bench_fn = cached_bench_prompt(bench_fn, provider)
+    handler = evaluator_handlers.get(benchmark_file.evaluator)
+    if handler is None:
+        raise ValueError(f"Unsupported evaluator: {benchmark_file.evaluator}")
+    if use_exec_cache:
+        execute = cached_execute_code({} if exec_cache is None else exec_cache)
     else:
-        # Parallel processing for other providers
-        with ThreadPoolExecutor() as executor:
-            futures = []
-            for i, prompt_row in enumerate(benchmark_file.prompts, 1):
-                futures.append(executor.submit(
-                    process_single_prompt,
-                    prompt_row,
-                    benchmark_file,
-                    provider,
-                    model_name,
-                    i,
-                    total_tests
-                ))
-            
-            for future in futures:
-                results.append(future.result())
-
-    return results
+        execute = execute_code_in_pool
+    evaluate = partial(handler, execute=execute)
+    base_prompt = benchmark_file.base_prompt
+    prompt_segments = split_prompt_template(
+        base_prompt,
+        (
+            str(key)
+            for prompt_row in benchmark_file.prompts
+            if prompt_row.dynamic_variables
+            for key in prompt_row.dynamic_variables
+        ),
+    )
+    # Templates without placeholders render to base_prompt for every row
+    has_placeholders = len(prompt_segments) > 1
 
+    if concurrency is None:
+        concurrency = provider_concurrency.get(provider, default_concurrency)
+    sem = asyncio.Semaphore(concurrency)
 
-# ------------------------- Report Generation -------------------------
-def generate_report(
-    complete_result: ExecEvalBenchmarkCompleteResult,
-) -> ExecEvalBenchmarkReport:
-    model_reports = []
-
-    # Group results by model
-    model_results = {}
-    for result in complete_result.results:
-        if result.model not in model_results:
-            model_results[result.model] = []
-        model_results[result.model].append(result)
+    async def _one(prompt_row, index):
+        if has_placeholders and prompt_row.dynamic_variables:
+            prompt = render_prompt(prompt_segments, prompt_row.dynamic_variables)
+        else:
+            prompt = base_prompt
+
+        result = await process_single_prompt(
+            prompt,
+            prompt_row,
+            evaluate,
+            bench_fn,
+            sem,
+            provider,
+            model_name,
+            index,
+            total_tests,
+        )
 
-    # Create model reports
-    for model, results in model_results.items():
-        correct_count = sum(1 for r in results if r.correct)
-        incorrect_count = len(results) - correct_count
-        accuracy = correct_count / len(results)
-
-        avg_tokens_per_second = sum(
-            r.prompt_response.tokens_per_second for r in results
-        ) / len(results)
-        avg_total_duration = sum(
-            r.prompt_response.total_duration_ms for r in results
-        ) / len(results)
-        avg_load_duration = sum(
-            r.prompt_response.load_duration_ms for r in results
-        ) / len(results)
+        if results_file is None:
+            return result
+        results_file.write(result.model_dump_json() + "\n")
 
-        model_reports.append(
-            ExecEvalBenchmarkModelReport(
-                model=model,
-                results=results,
-                correct_count=correct_count,
-                incorrect_count=incorrect_count,
-                accuracy=accuracy,
-                average_tokens_per_second=avg_tokens_per_second,
-                average_total_duration_ms=avg_total_duration,
-                average_load_duration_ms=avg_load_duration,
-            )
-        )
+    tasks = [
+        asyncio.create_task(_one(prompt_row, i))
+        for i, prompt_row in enumerate(benchmark_file.prompts, 1)
+    ]
+    results = await asyncio.gather(*tasks)
+    return [] if results_file is not None else list(results)
 
-    # Calculate overall statistics
-    overall_correct = sum(r.correct_count for r in model_reports)
-    overall_incorrect = sum(r.incorrect_count for r in model_reports)
-    overall_accuracy = overall_correct / (overall_correct + overall_incorrect)
 
-    avg_tokens_per_second = sum(
-        r.average_tokens_per_second for r in model_reports
-    ) / len(model_reports)
-    avg_total_duration = sum(r.average_total_duration_ms for r in model_reports) / len(
-        model_reports
-    )
-    avg_load_duration = sum(r.average_load_duration_ms for r in model_reports) / len(
-        model_reports
+def run_benchmark_for_model(
+    model: str,
+    benchmark_file: ExecEvalBenchmarkFile,
+    concurrency: Optional[int] = None,
+    use_cache: bool = True,
+    use_exec_cache: bool = True,
+    results_file: Optional[TextIO] = None,
+    exec_cache: Optional[dict[str, str]] = None,
+) -> List[ExeEvalBenchmarkOutputResult]:
+    """Synchronous wrapper around run_benchmark_for_model_async."""
+    return asyncio.run(
+        run_benchmark_for_model_async(
+            model,
+            benchmark_file,
+            concurrency,
+            use_cache,
+            use_exec_cache,
+            results_file,
+            exec_cache,
+        )
     )
 
+
+# ------------------------- Report Generation -------------------------
+def generate_report(
+    complete_result: ExecEvalBenchmarkCompleteResult,
+    results: Optional[Iterable[ExeEvalBenchmarkOutputResult]] = None,
+) -> ExecEvalBenchmarkReport:
     """Generate a comprehensive benchmark report from results.
-    
+
     Args:
         complete_result: Completed benchmark results
-        
+        results: Results to report on instead of complete_result.results,
+            e.g. load_results_jsonl() over a streamed results file. Consumed
+            in a single pass.
+
     Returns:
         ExecEvalBenchmarkReport containing aggregated statistics
     """
     model_reports = []
+    overall_correct = 0
+    overall_count = 0
+    overall_cached = 0
+    grand_tokens_per_second = grand_total_duration = grand_load_duration = 0.0
 
     # Group results by model
-    model_results = {}
-    for result in complete_result.results:
-        if result.model not in model_results:
-            model_results[result.model] = []
+    model_results: dict[str, list[ExeEvalBenchmarkOutputResult]] = defaultdict(list)
+    if results is None:
+        results = complete_result.results
+    for result in results:
         model_results[result.model].append(result)
 
-    # Create model reports
-    for model, results in model_results.items():
-        correct_count = sum(1 for r in results if r.correct)
-        incorrect_count = len(results) - correct_count
-        accuracy = correct_count / len(results)
-
-        avg_tokens_per_second = sum(
-            r.prompt_response.tokens_per_second for r in results
-        ) / len(results)
-        avg_total_duration = sum(
-            r.prompt_response.total_duration_ms for r in results
-        ) / len(results)
-        avg_load_duration = sum(
-            r.prompt_response.load_duration_ms for r in results
-        ) / len(results)
+    # Create model reports, aggregating each model's results in one pass
+    for model, model_result_list in model_results.items():
+        # Streamed results arrive in completion order
+        model_result_list.sort(key=lambda r: r.index)
+        correct_count = 0
+        cached_count = 0
+        sum_tokens_per_second = sum_total_duration = sum_load_duration = 0.0
+        for r in model_result_list:
+            correct_count += r.correct
+            prompt_response = r.prompt_response
+            # Cached responses carry timings from an earlier run
+            if prompt_response.cached:
+                cached_count += 1
+                continue
+            sum_tokens_per_second += prompt_response.tokens_per_second
+            sum_total_duration += prompt_response.total_duration_ms
+            sum_load_duration += prompt_response.load_duration_ms
+
+        n = len(model_result_list)
+        timed_n = n - cached_count
+        overall_correct += correct_count
+        overall_count += n
+        overall_cached += cached_count
+        grand_tokens_per_second += sum_tokens_per_second
+        grand_total_duration += sum_total_duration
+        grand_load_duration += sum_load_duration
 
         model_reports.append(
             ExecEvalBenchmarkModelReport(
                 model=model,
-                results=results,
+                results=model_result_list,
                 correct_count=correct_count,
-                incorrect_count=incorrect_count,
-                accuracy=accuracy,
-                average_tokens_per_second=avg_tokens_per_second,
-                average_total_duration_ms=avg_total_duration,
-                average_load_duration_ms=avg_load_duration,
+                incorrect_count=n - correct_count,
+                accuracy=correct_count / n,
+                average_tokens_per_second=(
+                    sum_tokens_per_second / timed_n if timed_n else 0.0
+                ),
+                average_total_duration_ms=(
+                    sum_total_duration / timed_n if timed_n else 0.0
+                ),
+                average_load_duration_ms=(
+                    sum_load_duration / timed_n if timed_n else 0.0
+                ),
+                cached_count=cached_count,
             )
         )
 
-    # Calculate overall statistics
-    overall_correct = sum(r.correct_count for r in model_reports)
-    overall_incorrect = sum(r.incorrect_count for r in model_reports)
-    overall_accuracy = overall_correct / (overall_correct + overall_incorrect)
-
-    avg_tokens_per_second = sum(
-        r.average_tokens_per_second for r in model_reports
-    ) / len(model_reports)
-    avg_total_duration = sum(r.average_total_duration_ms for r in model_reports) / len(
-        model_reports
-    )
-    avg_load_duration = sum(r.average_load_duration_ms for r in model_reports) / len(
-        model_reports
-    )
+    # Calculate overall statistics, weighting every result equally and
+    # leaving cached results out of the timing averages
+    overall_incorrect = overall_count - overall_correct
+    overall_accuracy = overall_correct / overall_count
+    overall_timed = overall_count - overall_cached
+    if overall_timed:
+        avg_tokens_per_second = grand_tokens_per_second / overall_timed
+        avg_total_duration = grand_total_duration / overall_timed
+        avg_load_duration = grand_load_duration / overall_timed
+    else:
+        avg_tokens_per_second = avg_total_duration = avg_load_duration = 0.0
 
     return ExecEvalBenchmarkReport(
         benchmark_name=complete_result.benchmark_file.benchmark_name,
@@ -336,4 +578,5 @@ def generate_report(
         average_tokens_per_second=avg_tokens_per_second,
         average_total_duration_ms=avg_total_duration,
         average_load_duration_ms=avg_load_duration,
+        cached_count=overall_cached,
     )
@@ -0,0 +1,213 @@
+"""
+Long-lived code execution worker.
+
+Started as ``python -m modules.exec_worker`` so it only imports the evaluator
+module, never the caller's main script. Jobs and replies are pickled and
+length-prefixed over the worker's stdin and stdout. Each job runs in a child
+forked from the worker, so snippets skip interpreter startup but can't leak
+state into each other. Where fork is unavailable (Windows) the worker runs a
+single job in-process and exits.
+"""
+
+import os
+import pickle
+import signal
+import struct
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from modules.execution_evaluators import execute_python_code_in_worker
+
+_HEADER = struct.Struct("!I")
+
+# Lets ``-m modules.exec_worker`` resolve however the caller was started
+_SERVER_DIR = str(Path(__file__).resolve().parent.parent)
+
+can_fork = hasattr(os, "fork")
+
+
+def send_message(stream: BinaryIO, message: object) -> None:
+    """Write a pickled, length-prefixed message and flush it."""
+    data = pickle.dumps(message)
+    stream.write(_HEADER.pack(len(data)) + data)
+    stream.flush()
+
+
+def recv_message(stream: BinaryIO) -> Optional[object]:
+    """Read one message written by send_message, or None at end of stream."""
+    header = stream.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    data = stream.read(_HEADER.unpack(header)[0])
+    return pickle.loads(data)
+
+
+def run_job(code: str, timeout_seconds: int) -> bytes:
+    """Run one snippet and return the pickled (ok, output or exception) reply."""
+    try:
+        reply = (True, execute_python_code_in_worker(code, timeout_seconds))
+    except BaseException as e:
+        reply = (False, e)
+    try:
+        return pickle.dumps(reply)
+    except Exception:
+        return pickle.dumps((False, RuntimeError(f"Execution error: {reply[1]!r}")))
+
+
+def run_job_in_child(code: str, timeout_seconds: int, keep_fds: tuple) -> bytes:
+    """Fork a child to run the snippet and return its reply."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # Child: drop the job pipes so the snippet can't touch them
+        os.close(read_fd)
+        for fd in keep_fds:
+            os.close(fd)
+        try:
+            data = run_job(code, timeout_seconds)
+            with os.fdopen(write_fd, "wb") as result_out:
+                result_out.write(data)
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as result_in:
+        data = result_in.read()
+    _, status = os.waitpid(pid, 0)
+    if not data:
+        # The snippet killed its process outright (e.g. os._exit)
+        return pickle.dumps(
+            (
+                False,
+                RuntimeError(
+                    "Execution error: snippet exited with code "
+                    f"{os.waitstatus_to_exitcode(status)}"
+                ),
+            )
+        )
+    return data
+
+
+def serve(job_in: BinaryIO, result_out: BinaryIO) -> None:
+    """Run (code, timeout_seconds) jobs from job_in until it is closed."""
+    keep_fds = (job_in.fileno(), result_out.fileno())
+    while True:
+        job = recv_message(job_in)
+        if job is None:
+            return
+        code, timeout_seconds = job
+        if can_fork:
+            data = run_job_in_child(code, timeout_seconds, keep_fds)
+        else:
+            data = run_job(code, timeout_seconds)
+        result_out.write(_HEADER.pack(len(data)) + data)
+        result_out.flush()
+        if not can_fork:
+            return
+
+
+class ExecWorker:
+    """Handle on one worker process, used from one thread at a time."""
+
+    def __init__(self) -> None:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (_SERVER_DIR, env.get("PYTHONPATH")) if p
+        )
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "modules.exec_worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=env,
+            # Own process group, so a kill also reaches the snippet's children
+            start_new_session=can_fork,
+        )
+        self._lock = threading.Lock()
+        self._job_done = True
+        self.timed_out = False
+
+    @property
+    def reusable(self) -> bool:
+        return can_fork and not self.timed_out and self.process.poll() is None
+
+    def kill(self) -> None:
+        if self.process.poll() is not None:
+            return
+        if can_fork:
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        else:
+            self.process.kill()
+        self.process.wait()
+
+    def close(self) -> None:
+        """Ask an idle worker to exit by closing its job pipe."""
+        try:
+            self.process.stdin.close()
+            self.process.wait(1)
+        except (OSError, subprocess.TimeoutExpired):
+            self.kill()
+        self.process.stdout.close()
+
+    def _kill_if_running(self) -> None:
+        with self._lock:
+            if self._job_done:
+                return
+            self.timed_out = True
+        self.kill()
+
+    def run(self, code: str, timeout_seconds: int, kill_after_seconds: float) -> str:
+        """Run a snippet, killing the worker if it outlives kill_after_seconds.
+
+        Raises:
+            TimeoutError: If the snippet timed out, in-process or by being killed
+            RuntimeError: If the worker died without reporting a result
+        """
+        self._job_done = False
+        timer = threading.Timer(kill_after_seconds, self._kill_if_running)
+        timer.daemon = True
+        timer.start()
+        try:
+            try:
+                send_message(self.process.stdin, (code, timeout_seconds))
+                reply = recv_message(self.process.stdout)
+            except OSError:
+                reply = None
+        finally:
+            with self._lock:
+                self._job_done = True
+            timer.cancel()
+
+        if reply is None:
+            if self.timed_out:
+                raise TimeoutError(
+                    f"Execution timed out after {timeout_seconds}s and was killed"
+                )
+            self.kill()
+            raise RuntimeError(
+                f"Execution error: worker exited with code {self.process.returncode}"
+            )
+        ok, payload = reply
+        if not ok:
+            raise payload
+        return payload
+
+
+def main() -> None:
+    # Keep the job pipes on private fds; anything else the worker prints
+    # goes to stderr instead of corrupting replies
+    job_in = os.fdopen(os.dup(0), "rb")
+    result_out = os.fdopen(os.dup(1), "wb")
+    with open(os.devnull, "rb") as devnull:
+        os.dup2(devnull.fileno(), 0)
+    os.dup2(2, 1)
+    serve(job_in, result_out)
+
+
+if __name__ == "__main__":
+    main()
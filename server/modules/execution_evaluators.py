@@ -1,6 +1,16 @@
+import io
+import os
+import re
+import signal
 import subprocess
+import sys
+import tempfile
+import traceback
 from modules.data_types import ExeEvalType
 
+# Wall-clock limit for a single snippet run by execute_python_code_in_worker
+exec_timeout_seconds = 30
+
 
 def eval_result_compare(evalType: ExeEvalType, expected: str, actual: str) -> bool:
     """
@@ -34,8 +44,6 @@ def execute_python_code(code: str) -> str:
     code = code.strip().strip("'").strip('"')
 
     # Create a temporary file with the code
-    import tempfile
-
     with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=True) as tmp:
         tmp.write(code)
         tmp.flush()
@@ -43,15 +51,115 @@ def execute_python_code(code: str) -> str:
         # Execute the temporary file using uv
         result = execute(f"uv run {tmp.name} --ignore-warnings")
 
-        # Try to parse the result as a number
+        return normalize_execution_output(result)
+
+
+def normalize_execution_output(result: str) -> str:
+    """Normalize numeric output to float format, otherwise return it unchanged."""
+    # Try to parse the result as a number
+    try:
+        # Remove any extra whitespace or newlines
+        cleaned_result = result.strip()
+        # Convert to float and back to string to normalize format
+        return str(float(cleaned_result))
+    except (ValueError, TypeError):
+        # If conversion fails, return the raw result
+        return result
+
+
+# uv resolves PEP 723 inline dependencies, which exec in a worker cannot
+inline_script_metadata_pattern = re.compile(r"(?m)^# /// script$")
+
+
+def execute_python_code_in_worker(
+    code: str, timeout_seconds: int = exec_timeout_seconds
+) -> str:
+    """
+    Execute Python code inside the current (warm) interpreter and return the
+    output in the same format as execute_python_code.
+
+    Meant to run in a throwaway child forked from a warm worker (see
+    modules.exec_worker) so snippets skip interpreter startup. File
+    descriptors 0-2 are pointed at /dev/null and temp files while the code
+    runs, so output from subprocesses and C extensions is captured too. Snippets declaring inline
+    script dependencies fall back to execute_python_code.
+
+    Raises:
+        TimeoutError: If the code runs longer than timeout_seconds
+    """
+    code = code.strip().strip("'").strip('"')
+    if inline_script_metadata_pattern.search(code):
+        return execute_python_code(code)
+
+    timed_out = False
+
+    def _raise_exec_timeout(signum, frame):
+        nonlocal timed_out
+        timed_out = True
+        raise TimeoutError(f"Execution timed out after {timeout_seconds}s")
+
+    std_streams = (sys.stdin, sys.stdout, sys.stderr)
+    cwd = os.getcwd()
+    use_alarm = hasattr(signal, "SIGALRM")
+    failed = False
+
+    with (
+        tempfile.TemporaryFile() as out_file,
+        tempfile.TemporaryFile() as err_file,
+        open(os.devnull, "rb") as devnull,
+    ):
+        for stream in std_streams[1:]:
+            if stream is not None:
+                stream.flush()
+        saved_fds = [os.dup(fd) for fd in (0, 1, 2)]
+        os.dup2(devnull.fileno(), 0)
+        os.dup2(out_file.fileno(), 1)
+        os.dup2(err_file.fileno(), 2)
+        sys.stdin = io.StringIO()
+        # Unbuffered so print() and subprocess output land in order
+        sys.stdout = io.TextIOWrapper(
+            io.FileIO(1, "w", closefd=False), write_through=True
+        )
+        sys.stderr = io.TextIOWrapper(
+            io.FileIO(2, "w", closefd=False), write_through=True
+        )
+        if use_alarm:
+            previous_handler = signal.signal(signal.SIGALRM, _raise_exec_timeout)
+            signal.alarm(timeout_seconds)
+
         try:
-            # Remove any extra whitespace or newlines
-            cleaned_result = result.strip()
-            # Convert to float and back to string to normalize format
-            return str(float(cleaned_result))
-        except (ValueError, TypeError):
-            # If conversion fails, return the raw result
-            return result
+            try:
+                exec(compile(code, "<generated>", "exec"), {"__name__": "__main__"})
+            except SystemExit as e:
+                failed = e.code not in (None, 0)
+                if isinstance(e.code, str):
+                    sys.stderr.write(e.code)
+            except BaseException:
+                failed = True
+                sys.stderr.write(traceback.format_exc())
+        finally:
+            if use_alarm:
+                signal.alarm(0)
+                signal.signal(signal.SIGALRM, previous_handler)
+            sys.stdout.flush()
+            sys.stderr.flush()
+            sys.stdin, sys.stdout, sys.stderr = std_streams
+            for fd, saved_fd in zip((0, 1, 2), saved_fds):
+                os.dup2(saved_fd, fd)
+                os.close(saved_fd)
+            os.chdir(cwd)
+
+        out_file.seek(0)
+        err_file.seek(0)
+        stdout = out_file.read().decode(errors="replace")
+        stderr = err_file.read().decode(errors="replace")
+
+    # Reported even if the snippet swallowed the TimeoutError
+    if timed_out:
+        raise TimeoutError(f"Execution timed out after {timeout_seconds}s")
+    if failed:
+        return f"Error: {stderr}"
+    return normalize_execution_output(stdout)
 
 
 def execute(code: str) -> str:
@@ -0,0 +1,91 @@
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Callable, Optional
+from modules.data_types import BenchPromptResponse
+
+# On-disk cache of successful bench_prompt responses keyed on
+# (provider, model, prompt). Lets benchmark re-runs skip identical LLM calls.
+default_cache_path = Path.home() / ".benchy_cache" / "bench_responses.sqlite3"
+
+
+def _cache_key(provider: str, model_name: str, prompt: str) -> bytes:
+    return hashlib.blake2b(f"{provider}\0{model_name}\0{prompt}".encode()).digest()
+
+
+def _connect(cache_path: Optional[Path]) -> sqlite3.Connection:
+    path = Path(cache_path or default_cache_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS bench_responses (key BLOB PRIMARY KEY, value TEXT)"
+    )
+    return conn
+
+
+def get_cached_bench_response(
+    provider: str, model_name: str, prompt: str, cache_path: Optional[Path] = None
+) -> Optional[BenchPromptResponse]:
+    """
+    Look up a cached response. Hits are returned with cached=True so reports
+    can tell their timings came from an earlier run.
+    """
+    conn = _connect(cache_path)
+    try:
+        row = conn.execute(
+            "SELECT value FROM bench_responses WHERE key = ?",
+            (_cache_key(provider, model_name, prompt),),
+        ).fetchone()
+    finally:
+        conn.close()
+
+    if row is None:
+        return None
+    return BenchPromptResponse.model_validate_json(row[0]).model_copy(
+        update={"cached": True}
+    )
+
+
+def cache_bench_response(
+    provider: str,
+    model_name: str,
+    prompt: str,
+    response: BenchPromptResponse,
+    cache_path: Optional[Path] = None,
+) -> None:
+    """Store a response in the cache, replacing any existing entry."""
+    conn = _connect(cache_path)
+    try:
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO bench_responses (key, value) VALUES (?, ?)",
+                (
+                    _cache_key(provider, model_name, prompt),
+                    response.model_dump_json(),
+                ),
+            )
+    finally:
+        conn.close()
+
+
+def cached_bench_prompt(
+    bench_fn: Callable[[str, str], BenchPromptResponse],
+    provider: str,
+    cache_path: Optional[Path] = None,
+) -> Callable[[str, str], BenchPromptResponse]:
+    """
+    Wrap a provider's bench_prompt so identical prompts are served from the
+    cache. Errored responses are never cached.
+    """
+
+    def bench_prompt(prompt: str, model_name: str) -> BenchPromptResponse:
+        cached = get_cached_bench_response(provider, model_name, prompt, cache_path)
+        if cached is not None:
+            return cached
+
+        response = bench_fn(prompt, model_name)
+        if not response.errored:
+            cache_bench_response(provider, model_name, prompt, response, cache_path)
+        return response
+
+    return bench_prompt
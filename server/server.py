@@ -18,6 +18,7 @@ from modules.exbench_module import (
     generate_report,
     save_report_to_file,
 )
+from utils import setup_queue_logging
 
 app = Flask(__name__)
 
@@ -146,10 +147,15 @@ def handle_iso_speed_bench():
             benchmark_file=benchmark_file, results=[]
         )
 
+        # Scoped to this request so executions are only shared between its models
+        exec_cache: dict[str, str] = {}
         for model in benchmark_file.models:
             try:
                 print(f"Running benchmark for model {model}")
-                results = run_benchmark_for_model(model, benchmark_file)
+                # UI runs measure speed, so always hit the providers
+                results = run_benchmark_for_model(
+                    model, benchmark_file, use_cache=False, exec_cache=exec_cache
+                )
                 complete_result.results.extend(results)
             except Exception as e:
                 print(f"Error running benchmark for model {model}: {str(e)}")
@@ -182,6 +188,7 @@ def handle_iso_speed_bench():
 
 def main():
     """Run the Flask application."""
+    setup_queue_logging()
     app.run(debug=True, port=5000)
 
 
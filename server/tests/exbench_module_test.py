@@ -0,0 +1,455 @@
+import os
+import threading
+import time
+
+import pytest
+
+from modules import exbench_module, response_cache
+from modules.data_types import BenchPromptResponse, ExecEvalBenchmarkFile, ExeEvalType
+
+
+@pytest.fixture(autouse=True)
+def isolated_response_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        response_cache, "default_cache_path", tmp_path / "bench_responses.sqlite3"
+    )
+
+
+def make_benchmark_file(prompt_count: int) -> ExecEvalBenchmarkFile:
+    return ExecEvalBenchmarkFile(
+        base_prompt="Say {{word}}",
+        evaluator="raw_string_evaluator",
+        prompts=[
+            {"dynamic_variables": {"word": f"w{i}"}, "expectation": f"Say w{i}"}
+            for i in range(prompt_count)
+        ],
+        benchmark_name="Echo",
+        purpose="Test",
+        models=["openai~echo"],
+    )
+
+
+def echo_bench_prompt(prompt: str, model: str) -> BenchPromptResponse:
+    return BenchPromptResponse(
+        response=prompt,
+        tokens_per_second=10.0,
+        provider="openai",
+        total_duration_ms=100.0,
+        load_duration_ms=0.0,
+    )
+
+
+def test_run_benchmark_for_model_concurrent(monkeypatch):
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_echo(prompt: str, model: str) -> BenchPromptResponse:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return echo_bench_prompt(prompt, model)
+
+    monkeypatch.setitem(exbench_module.provider_bench_functions, "openai", slow_echo)
+
+    results = exbench_module.run_benchmark_for_model(
+        "openai~echo", make_benchmark_file(6), concurrency=3
+    )
+
+    assert [r.index for r in results] == [1, 2, 3, 4, 5, 6]
+    assert all(r.correct for r in results)
+    assert results[0].input_prompt == "Say w0"
+    assert results[0].model == "openai~echo"
+    assert peak == 3
+
+
+def test_run_benchmark_for_model_retries_then_errors(monkeypatch):
+    def failing(prompt: str, model: str) -> BenchPromptResponse:
+        raise RuntimeError("boom")
+
+    async def no_sleep(_):
+        return None
+
+    monkeypatch.setitem(exbench_module.provider_bench_functions, "openai", failing)
+    monkeypatch.setattr(exbench_module.asyncio, "sleep", no_sleep)
+
+    results = exbench_module.run_benchmark_for_model(
+        "openai~echo", make_benchmark_file(1)
+    )
+
+    assert results[0].prompt_response.errored
+    assert results[0].prompt_response.response == "Error: boom"
+    assert not results[0].correct
+
+
+def test_execute_code_in_pool():
+    import asyncio
+
+    result = asyncio.run(exbench_module.execute_code_in_pool("print(2 + 3)"))
+    assert result == "5.0"
+
+
+def test_render_prompt():
+    segments = exbench_module.split_prompt_template(
+        "a {{x}} b {{y}} c {{x}} {{z}} {{w}}", ["x", "y", "z"]
+    )
+    assert exbench_module.render_prompt(segments, {"x": 1, "y": "two"}) == (
+        "a 1 b two c 1 {{z}} {{w}}"
+    )
+
+
+def test_render_prompt_names_with_special_characters():
+    segments = exbench_module.split_prompt_template(
+        "{{first-name}} {{a.b}} {{two words}} {{a}}",
+        ["first-name", "a.b", "two words", "a"],
+    )
+    assert exbench_module.render_prompt(
+        segments, {"first-name": "Ada", "a.b": 1, "two words": "ok", "a": "x"}
+    ) == "Ada 1 ok x"
+
+
+def test_split_prompt_template_without_variables():
+    assert exbench_module.split_prompt_template("no {{vars}}", []) == ["no {{vars}}"]
+
+
+def make_result(model: str, correct: bool, tokens_per_second: float, index: int):
+    from modules.data_types import ExeEvalBenchmarkOutputResult
+
+    return ExeEvalBenchmarkOutputResult(
+        prompt_response=BenchPromptResponse(
+            response="",
+            tokens_per_second=tokens_per_second,
+            provider="ollama",
+            total_duration_ms=tokens_per_second * 10,
+            load_duration_ms=1.0,
+        ),
+        execution_result="",
+        expected_result="",
+        input_prompt="",
+        model=model,
+        correct=correct,
+        index=index,
+    )
+
+
+def test_generate_report():
+    from modules.data_types import ExecEvalBenchmarkCompleteResult
+
+    complete_result = ExecEvalBenchmarkCompleteResult(
+        benchmark_file=make_benchmark_file(0),
+        results=[
+            make_result("a", True, 10.0, 1),
+            make_result("a", False, 20.0, 2),
+            make_result("b", True, 30.0, 1),
+            make_result("b", True, 50.0, 2),
+            make_result("b", True, 40.0, 3),
+        ],
+    )
+
+    report = exbench_module.generate_report(complete_result)
+
+    assert [m.model for m in report.models] == ["a", "b"]
+    model_a, model_b = report.models
+    assert model_a.correct_count == 1
+    assert model_a.incorrect_count == 1
+    assert model_a.accuracy == 0.5
+    assert model_a.average_tokens_per_second == 15.0
+    assert model_a.average_total_duration_ms == 150.0
+    assert model_b.accuracy == 1.0
+    assert model_b.average_tokens_per_second == 40.0
+    assert report.overall_correct_count == 4
+    assert report.overall_incorrect_count == 1
+    assert report.overall_accuracy == 0.8
+    # Weighted by result count, not a mean of the per-model means (27.5)
+    assert report.average_tokens_per_second == 30.0
+    assert report.average_load_duration_ms == 1.0
+
+
+def test_parse_model_string():
+    assert exbench_module.parse_model_string("llama3.2:1b") == ("ollama", "llama3.2:1b")
+    assert exbench_module.parse_model_string("openai~gpt-4o") == ("openai", "gpt-4o")
+    assert exbench_module.parse_model_string("ollama~a~b") == ("ollama", "a~b")
+    with pytest.raises(ValueError):
+        exbench_module.parse_model_string("groq~llama")
+
+
+def test_save_report_to_file(tmp_path):
+    import json
+    from modules.data_types import ExecEvalBenchmarkCompleteResult
+
+    report = exbench_module.generate_report(
+        ExecEvalBenchmarkCompleteResult(
+            benchmark_file=make_benchmark_file(0),
+            results=[make_result("a", True, 10.0, 1)],
+        )
+    )
+
+    report_path = exbench_module.save_report_to_file(report, str(tmp_path))
+
+    assert report_path.startswith(f"{tmp_path}/Echo_")
+    with open(report_path) as f:
+        assert json.load(f) == report.model_dump(mode="json")
+
+
+def test_run_benchmark_for_model_num_output(monkeypatch):
+    benchmark_file = make_benchmark_file(2)
+    benchmark_file.evaluator = ExeEvalType.execute_python_code_with_num_output
+    benchmark_file.prompts[0].expectation = "4"
+    benchmark_file.prompts[1].expectation = "5"
+
+    def code_bench_prompt(prompt: str, model: str) -> BenchPromptResponse:
+        return BenchPromptResponse(
+            response="```python\nprint(2 + 2)\n```",
+            tokens_per_second=0.0,
+            provider="openai",
+            total_duration_ms=0.0,
+            load_duration_ms=0.0,
+        )
+
+    monkeypatch.setitem(
+        exbench_module.provider_bench_functions, "openai", code_bench_prompt
+    )
+
+    results = exbench_module.run_benchmark_for_model("openai~coder", benchmark_file)
+
+    assert [r.execution_result for r in results] == ["4.0", "4.0"]
+    assert [r.correct for r in results] == [True, False]
+
+
+def test_run_benchmark_for_model_uses_response_cache(monkeypatch):
+    calls = 0
+
+    def counting_echo(prompt: str, model: str) -> BenchPromptResponse:
+        nonlocal calls
+        calls += 1
+        return echo_bench_prompt(prompt, model)
+
+    monkeypatch.setitem(
+        exbench_module.provider_bench_functions, "openai", counting_echo
+    )
+    benchmark_file = make_benchmark_file(2)
+
+    first = exbench_module.run_benchmark_for_model("openai~echo", benchmark_file)
+    second = exbench_module.run_benchmark_for_model("openai~echo", benchmark_file)
+    uncached = exbench_module.run_benchmark_for_model(
+        "openai~echo", benchmark_file, use_cache=False
+    )
+
+    assert calls == 4
+    assert not any(r.prompt_response.cached for r in first)
+    assert all(r.prompt_response.cached for r in second)
+    assert [r.prompt_response.response for r in second] == [
+        r.prompt_response.response for r in first
+    ]
+    assert not any(r.prompt_response.cached for r in uncached)
+
+
+def test_cached_execute_code_reuses_output(monkeypatch):
+    import asyncio
+
+    calls = []
+
+    async def fake_execute(code: str) -> str:
+        calls.append(code)
+        if "fail" in code:
+            raise RuntimeError("Execution error: broken pool")
+        return "42.0"
+
+    monkeypatch.setattr(exbench_module, "execute_code_in_pool", fake_execute)
+    exec_cache = {}
+    execute = exbench_module.cached_execute_code(exec_cache)
+
+    async def run():
+        assert await execute("print(6 * 7)") == "42.0"
+        assert await execute("print(6 * 7)") == "42.0"
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await execute("fail")
+
+    asyncio.run(run())
+
+    assert calls == ["print(6 * 7)", "fail", "fail"]
+    assert exec_cache == {"print(6 * 7)": "42.0"}
+
+
+def test_execute_code_recovers_from_killed_worker():
+    with pytest.raises(RuntimeError, match="Execution error:"):
+        exbench_module.execute_code("import os\nos._exit(1)")
+    assert exbench_module.execute_code("print('ok')") == "ok\n"
+
+
+def test_stream_results_to_jsonl(tmp_path, monkeypatch):
+    from modules.data_types import ExecEvalBenchmarkCompleteResult
+
+    monkeypatch.setitem(
+        exbench_module.provider_bench_functions, "openai", echo_bench_prompt
+    )
+    benchmark_file = make_benchmark_file(3)
+    results_path = tmp_path / "results.jsonl"
+
+    with open(results_path, "w") as results_file:
+        returned = exbench_module.run_benchmark_for_model(
+            "openai~echo", benchmark_file, results_file=results_file
+        )
+
+    assert returned == []
+    streamed = list(exbench_module.load_results_jsonl(str(results_path)))
+    assert sorted(r.index for r in streamed) == [1, 2, 3]
+
+    report = exbench_module.generate_report(
+        ExecEvalBenchmarkCompleteResult(benchmark_file=benchmark_file, results=[]),
+        exbench_module.load_results_jsonl(str(results_path)),
+    )
+    assert [r.index for r in report.models[0].results] == [1, 2, 3]
+    assert report.overall_correct_count == 3
+
+
+def test_code_execution_overlaps_next_llm_call(monkeypatch):
+    events = []
+
+    def recording_echo(prompt: str, model: str) -> BenchPromptResponse:
+        events.append(("llm_start", prompt))
+        time.sleep(0.05)
+        events.append(("llm_end", prompt))
+        return echo_bench_prompt(prompt, model)
+
+    async def slow_evaluate(cleaned_code, expected_result, execute=None):
+        import asyncio
+
+        events.append(("eval_start", cleaned_code))
+        await asyncio.sleep(0.2)
+        events.append(("eval_end", cleaned_code))
+        return cleaned_code, True
+
+    monkeypatch.setitem(
+        exbench_module.provider_bench_functions, "openai", recording_echo
+    )
+    monkeypatch.setitem(
+        exbench_module.evaluator_handlers,
+        ExeEvalType.raw_string_evaluator,
+        slow_evaluate,
+    )
+
+    exbench_module.run_benchmark_for_model(
+        "openai~echo", make_benchmark_file(2), concurrency=1
+    )
+
+    # The second LLM call starts while the first result is still evaluating
+    assert events.index(("llm_start", "Say w1")) < events.index(
+        ("eval_end", "Say w0")
+    )
+
+
+def test_execute_code_from_many_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=8) as threads:
+        outputs = list(
+            threads.map(lambda n: exbench_module.execute_code(f"print({n})"), range(8))
+        )
+
+    assert outputs == [f"{float(n)}" for n in range(8)]
+
+
+def test_execute_code_does_not_leak_state_between_snippets():
+    exbench_module.execute_code(
+        "import builtins\nbuiltins.print = lambda *a, **k: None"
+    )
+    assert exbench_module.execute_code("print(5)") == "5.0"
+
+
+def test_execute_code_captures_subprocess_output():
+    code = "import subprocess\nsubprocess.run(['echo', 'from child'])"
+    assert exbench_module.execute_code(code) == "from child\n"
+
+
+def test_execute_code_kills_snippets_that_swallow_timeouts(monkeypatch):
+    from modules import execution_evaluators
+
+    monkeypatch.setattr(execution_evaluators, "exec_timeout_seconds", 1)
+    monkeypatch.setattr(exbench_module, "exec_kill_grace_seconds", 1)
+    code = (
+        "import time\n"
+        "while True:\n"
+        "    try:\n"
+        "        time.sleep(10)\n"
+        "    except TimeoutError:\n"
+        "        pass"
+    )
+
+    started = time.perf_counter()
+    with pytest.raises(TimeoutError, match="killed"):
+        exbench_module.execute_code(code)
+    assert time.perf_counter() - started < 10
+    assert exbench_module.execute_code("print(1)") == "1.0"
+
+
+def test_execute_code_beats_uv_run_under_exbench_main(tmp_path):
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    server_dir = Path(__file__).resolve().parent.parent
+    imports_log = tmp_path / "imports.log"
+    script = tmp_path / "bench_exec.py"
+    script.write_text(
+        f"""
+with open({str(imports_log)!r}, "a") as log:
+    log.write("imported\\n")
+
+import time
+import exbench  # same heavy imports as the real CLI entry point
+from modules.exbench_module import execute_code
+from modules.execution_evaluators import execute_python_code
+
+
+def average_seconds(fn, runs=10):
+    fn("print(0)")
+    started = time.perf_counter()
+    for n in range(runs):
+        fn(f"print({{n}})")
+    return (time.perf_counter() - started) / runs
+
+
+if __name__ == "__main__":
+    print(average_seconds(execute_code), average_seconds(execute_python_code))
+"""
+    )
+
+    completed = subprocess.run(
+        [sys.executable, str(script)],
+        cwd=server_dir,
+        env={**os.environ, "PYTHONPATH": str(server_dir)},
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    worker_seconds, uv_seconds = map(float, completed.stdout.split())
+    assert worker_seconds < uv_seconds
+    # Workers never re-import the caller's main module
+    assert imports_log.read_text() == "imported\n"
+
+
+def test_generate_report_excludes_cached_timings():
+    from modules.data_types import ExecEvalBenchmarkCompleteResult
+
+    cached = make_result("a", True, 100.0, 2)
+    cached.prompt_response.cached = True
+    report = exbench_module.generate_report(
+        ExecEvalBenchmarkCompleteResult(
+            benchmark_file=make_benchmark_file(0),
+            results=[make_result("a", True, 10.0, 1), cached],
+        )
+    )
+
+    assert report.models[0].cached_count == 1
+    assert report.models[0].accuracy == 1.0
+    assert report.models[0].average_tokens_per_second == 10.0
+    assert report.cached_count == 1
+    assert report.average_total_duration_ms == 100.0
@@ -0,0 +1,55 @@
+import pytest
+
+from modules import execution_evaluators
+from modules.execution_evaluators import execute_python_code_in_worker
+
+
+def test_execute_python_code_in_worker_numeric_output():
+    assert execute_python_code_in_worker("print(1 + 1)") == "2.0"
+
+
+def test_execute_python_code_in_worker_string_output():
+    code = 'if __name__ == "__main__":\n    print("hello")'
+    assert execute_python_code_in_worker(code) == "hello\n"
+
+
+def test_execute_python_code_in_worker_isolates_globals():
+    execute_python_code_in_worker("leaked = 1")
+    assert execute_python_code_in_worker("print('leaked' in globals())") == "False\n"
+
+
+def test_execute_python_code_in_worker_errors():
+    result = execute_python_code_in_worker("raise ValueError('bad')")
+    assert result.startswith("Error: Traceback")
+    assert "ValueError: bad" in result
+
+    assert execute_python_code_in_worker("import sys\nsys.exit(2)") == "Error: "
+    assert execute_python_code_in_worker("import sys\nsys.exit(0)") == ""
+
+
+def test_execute_python_code_in_worker_timeout():
+    with pytest.raises(TimeoutError):
+        execute_python_code_in_worker("while True:\n    pass", timeout_seconds=1)
+
+
+def test_execute_python_code_in_worker_reports_swallowed_timeout():
+    code = "import time\ntry:\n    time.sleep(10)\nexcept TimeoutError:\n    print('caught')"
+    with pytest.raises(TimeoutError):
+        execute_python_code_in_worker(code, timeout_seconds=1)
+
+
+def test_execute_python_code_in_worker_captures_fd_output():
+    code = "import os\nprint('a')\nos.write(1, b'b\\n')\nprint('c')"
+    assert execute_python_code_in_worker(code) == "a\nb\nc\n"
+
+
+def test_execute_python_code_in_worker_inline_script_uses_uv(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        execution_evaluators,
+        "execute_python_code",
+        lambda code: calls.append(code) or "uv",
+    )
+    code = "# /// script\n# dependencies = []\n# ///\nprint(1)"
+    assert execute_python_code_in_worker(code) == "uv"
+    assert calls == [code]
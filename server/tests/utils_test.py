@@ -25,3 +25,31 @@ This is the answer'''
     
     assert thoughts == "Unclosed thought process"
     assert response == "This is the answer"
+
+
+def test_setup_queue_logging_is_idempotent():
+    import atexit
+    import logging
+    from logging.handlers import QueueHandler
+    import utils
+
+    root = logging.getLogger()
+    app_logger = logging.getLogger("modules")
+    root_level, app_level = root.level, app_logger.level
+
+    listener = utils.setup_queue_logging()
+    try:
+        assert utils.setup_queue_logging() is listener
+
+        queue_handlers = [h for h in root.handlers if isinstance(h, QueueHandler)]
+        assert len(queue_handlers) == 1
+        assert root.level == root_level
+        assert app_logger.level == logging.INFO
+    finally:
+        for handler in root.handlers[:]:
+            if isinstance(handler, QueueHandler):
+                root.removeHandler(handler)
+        listener.stop()
+        atexit.unregister(listener.stop)
+        utils._queue_listener = None
+        app_logger.setLevel(app_level)
@@ -1,6 +1,10 @@
+import atexit
+import logging
+import queue
 import time
 from contextlib import contextmanager
-from typing import Generator
+from logging.handlers import QueueHandler, QueueListener
+from typing import Generator, Optional
 from modules.data_types import ModelAlias
 
 
@@ -21,6 +25,39 @@ def timeit() -> Generator[None, None, float]:
     yield lambda: int((time.perf_counter() - start) * 1000)
 
 
+_queue_listener: Optional[QueueListener] = None
+
+
+def setup_queue_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Route root logger output through a queue drained by a background thread,
+    so hot loops (e.g. concurrent benchmark prompts) only enqueue records
+    instead of formatting and writing to the terminal themselves.
+
+    The root logger keeps its default WARNING level so third-party libraries
+    (httpx, SDK clients) stay quiet; ``level`` only applies to the app's own
+    loggers under ``modules``.
+
+    Safe to call more than once; the listener is started on the first call
+    and flushed at interpreter exit.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        return _queue_listener
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    logging.getLogger().addHandler(QueueHandler(log_queue))
+    logging.getLogger("modules").setLevel(level)
+
+    _queue_listener = QueueListener(log_queue, stream_handler)
+    _queue_listener.start()
+    atexit.register(_queue_listener.stop)
+    return _queue_listener
+
+
 MAP_MODEL_ALIAS_TO_COST_PER_MILLION_TOKENS = {
     ModelAlias.gpt_4o_mini: {
         "input": 0.15,
@@ -125,6 +125,7 @@ export interface ExecEvalBenchmarkReport {
     average_tokens_per_second: number;
     average_total_duration_ms: number;
     average_load_duration_ms: number;
+    cached_count?: number;
 }
 
 export interface ExecEvalBenchmarkModelReport {
@@ -136,6 +137,7 @@ export interface ExecEvalBenchmarkModelReport {
     average_tokens_per_second: number;
     average_total_duration_ms: number;
     average_load_duration_ms: number;
+    cached_count?: number;
 }
 
 export interface BenchPromptResponse {
@@ -145,6 +147,7 @@ export interface BenchPromptResponse {
     total_duration_ms: number;
     load_duration_ms: number;
     errored: boolean | null;
+    cached?: boolean | null;
 }
 
 export interface ExecEvalBenchmarkOutputResult {